@@ -1,60 +1,190 @@
-from dash import Dash, dcc, html, Input, Output, clientside_callback
+from dash import Dash, dcc, html, Input, Output, State, clientside_callback
 import dash_bootstrap_components as dbc
-import pandas as pd
+from plotly.io.json import to_json_plotly
 import numpy as np
+import csv
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # ---------------------------
 # Constants and Data Loading
 # ---------------------------
 SEASON_FILTER = '2023-24'
 NUM_SIMULATIONS = 10_000
+NUM_SHARDS = 8                 # seeded streams / row splits; fixed so results don't depend on the host
+NUM_WORKERS = min(NUM_SHARDS, os.cpu_count() or 1)  # threads only; never changes the results
+RANDOM_SEED = 42
+BLOCK_SIZE = 1024              # simulations sampled per cache-resident block
+SALAH_GAMES = range(10, 39)    # Salah slider positions
+LEBRON_GAMES = range(60, 83)   # LeBron slider positions
+
+def load_columns(path: str, columns: dict[str, type | str]) -> np.ndarray:
+    """Parse only the named CSV columns straight into a typed structured array.
+
+    The header goes through the csv module and the rows through np.loadtxt with
+    the same quoting rules, so a quoted field containing a comma can't shift
+    the columns.
+    """
+    with open(path, newline='') as f:
+        header = next(csv.reader(f))
+    return np.loadtxt(path, delimiter=',', quotechar='"', skiprows=1, ndmin=1,
+                      usecols=[header.index(name) for name in columns],
+                      dtype=list(columns.items()))
 
 # --- Mohamed Salah Data ---
 CSV_FILE_SALAH = "mo_salah.csv"
-df_salah = pd.read_csv(CSV_FILE_SALAH, usecols=['SEASON', 'G', 'A'])
-df_salah = df_salah.loc[df_salah['SEASON'] == SEASON_FILTER]
-goals = df_salah['G'].to_numpy()
-assists = df_salah['A'].to_numpy()
+# Per-match goals/assists are single digits and season totals fit in int16.
+# SEASON gets headroom: loadtxt truncates longer strings, which could then match the filter
+salah_rows = load_columns(CSV_FILE_SALAH, {'SEASON': 'U16', 'G': np.int8, 'A': np.int8})
+in_season = salah_rows['SEASON'] == SEASON_FILTER
+goals = salah_rows['G'][in_season]
+assists = salah_rows['A'][in_season]
 
 # --- LeBron James Data ---
 CSV_FILE_LEBRON = "statmuse (1).csv"
-df_lebron = pd.read_csv(CSV_FILE_LEBRON)
-PTS = df_lebron['PTS'].values
-REB = df_lebron['REB'].values
-AST = df_lebron['AST'].values
+# Single-game box-score stats fit in int16, the same width as the running totals
+lebron_rows = load_columns(CSV_FILE_LEBRON, {'PTS': np.int16, 'REB': np.int16, 'AST': np.int16})
+# Fields of a structured array are strided views; copy each into its own buffer
+PTS = np.ascontiguousarray(lebron_rows['PTS'])
+REB = np.ascontiguousarray(lebron_rows['REB'])
+AST = np.ascontiguousarray(lebron_rows['AST'])
 
-# Use modern random generator
-rng = np.random.default_rng()
+# The resampling sources are shared by every worker thread; freeze them
+for stat in (goals, assists, PTS, REB, AST):
+    stat.setflags(write=False)
+
+# One independent PCG64DXSM stream per shard, spawned once from a single seed
+shard_rngs = [np.random.Generator(np.random.PCG64DXSM(seed))
+              for seed in np.random.SeedSequence(RANDOM_SEED).spawn(NUM_SHARDS)]
 
 # ---------------------------
 # Monte Carlo Simulation Functions
 # ---------------------------
-def monte_carlo_simulation_salah(num_games: int) -> tuple[np.ndarray, np.ndarray]:
-    """Monte Carlo simulation for Salah (Goals, Assists)."""
-    size = (NUM_SIMULATIONS, num_games)
-    goals_sim = rng.choice(goals, size=size).sum(axis=1)
-    assists_sim = rng.choice(assists, size=size).sum(axis=1)
-    return goals_sim, assists_sim
-
-def monte_carlo_simulation_lebron(num_games: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    """Monte Carlo simulation for LeBron (PTS, AST, REB per game)."""
-    size = (NUM_SIMULATIONS, num_games)
-    simulated_pts = np.random.choice(PTS, size=size, replace=True).sum(axis=1) / num_games
-    simulated_ast = np.random.choice(AST, size=size, replace=True).sum(axis=1) / num_games
-    simulated_reb = np.random.choice(REB, size=size, replace=True).sum(axis=1) / num_games
-    return simulated_pts, simulated_ast, simulated_reb
-
-def create_histogram(data: np.ndarray, color: str, title: str) -> dict:
-    """Generate Plotly histogram figure configuration."""
-    mean = data.mean()
-    p5, p95 = np.percentile(data, [5, 95])
+def _run_blocks(simulate_block, shard_rng, *outputs: np.ndarray) -> None:
+    """Fill one shard BLOCK_SIZE rows at a time.
+
+    Each block's sampled indices and gathered values stay in cache between
+    the gather and the reduction instead of round-tripping through memory.
+    """
+    for start in range(0, len(outputs[0]), BLOCK_SIZE):
+        simulate_block(shard_rng, *(out[start:start + BLOCK_SIZE] for out in outputs))
+
+def _run_sharded(simulate_block, *outputs: np.ndarray) -> None:
+    """Split the simulations into NUM_SHARDS shards and run them on threads.
+
+    NumPy releases the GIL while sampling, gathering and reducing, so the
+    shards run in parallel. Shard ``i`` always draws from ``shard_rngs[i]`` and
+    fills the same rows of ``outputs``, whatever the thread count. The threads
+    only shorten the one startup draw (~25 ms serial), and ``os.cpu_count()``
+    reports the host's cores rather than a container's CPU limit.
+    """
+    bounds = np.linspace(0, NUM_SIMULATIONS, NUM_SHARDS + 1, dtype=int)
+    shards = [
+        (simulate_block, shard_rng, *(out[start:stop] for out in outputs))
+        for shard_rng, start, stop in zip(shard_rngs, bounds[:-1], bounds[1:])
+    ]
+    if NUM_WORKERS == 1:
+        for shard in shards:
+            _run_blocks(*shard)
+        return
+    with ThreadPoolExecutor(max_workers=NUM_WORKERS) as pool:
+        futures = [pool.submit(_run_blocks, *shard) for shard in shards]
+    for future in futures:
+        future.result()
+
+def _salah_block(shard_rng, out_goals, out_assists):
+    """NumPy sampler for one block of Salah running totals."""
+    idx = shard_rng.integers(0, goals.size, size=out_goals.shape, dtype=np.int32)
+    goals[idx].cumsum(axis=1, dtype=np.int16, out=out_goals)
+    assists[idx].cumsum(axis=1, dtype=np.int16, out=out_assists)
+
+def _lebron_block(shard_rng, out_pts, out_ast, out_reb):
+    """NumPy sampler for one block of LeBron running totals."""
+    # PTS, AST and REB are read from the same resampled games
+    idx = shard_rng.integers(0, PTS.size, size=out_pts.shape, dtype=np.int32)
+    for stat, out in ((PTS, out_pts), (AST, out_ast), (REB, out_reb)):
+        stat[idx].cumsum(axis=1, dtype=np.int16, out=out)
+
+def _by_games_played(*running_totals: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Transpose running totals to contiguous, read-only (game, simulation) arrays.
+
+    Row ``n - 1`` then holds every simulation's total after ``n`` games.
+    """
+    by_games = tuple(np.ascontiguousarray(totals.T) for totals in running_totals)
+    for totals in by_games:
+        totals.setflags(write=False)
+    return by_games
+
+def monte_carlo_simulation_salah(max_games: int) -> tuple[np.ndarray, np.ndarray]:
+    """Monte Carlo simulation for Salah (Goals, Assists).
+
+    Each simulation resamples ``max_games`` matches once and keeps running
+    totals, so every shorter season is a prefix of the same draw: row
+    ``n - 1`` of the result holds the totals after ``n`` matches. Goals and
+    assists are read from the same resampled matches.
+    """
+    running = np.empty((2, NUM_SIMULATIONS, max_games), dtype=np.int16)
+    _run_sharded(_salah_block, *running)
+    return _by_games_played(*running)
+
+def monte_carlo_simulation_lebron(max_games: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Monte Carlo simulation for LeBron (PTS, AST, REB running totals), laid out like Salah's."""
+    # 82 games at LeBron's single-game highs is still only a few thousand, well inside int16
+    running = np.empty((3, NUM_SIMULATIONS, max_games), dtype=np.int16)
+    _run_sharded(_lebron_block, *running)
+    return _by_games_played(*running)
+
+# One draw per player at startup covers every slider position; callbacks only look it up
+salah_goals_cum, salah_assists_cum = monte_carlo_simulation_salah(SALAH_GAMES[-1])
+SALAH_SIMULATIONS = {n: (salah_goals_cum[n - 1], salah_assists_cum[n - 1]) for n in SALAH_GAMES}
+lebron_cum = monte_carlo_simulation_lebron(LEBRON_GAMES[-1])
+# LeBron's entries stay integer season totals so they bin exactly; divide by n for per-game
+LEBRON_SIMULATIONS = {n: tuple(totals[n - 1] for totals in lebron_cum) for n in LEBRON_GAMES}
+
+def quantiles_from_counts(counts: np.ndarray, qs) -> np.ndarray:
+    """Bin index where the cumulative count first reaches each quantile in ``qs``.
+
+    Integer totals have only a few dozen distinct values, so this replaces a
+    partition of all 10 000 samples with a scan over their bin counts.
+    """
+    cumulative = counts.cumsum()
+    return np.searchsorted(cumulative, np.multiply(qs, cumulative[-1]))
+
+def mean_from_counts(counts: np.ndarray) -> float:
+    """Mean of integer samples from their bin counts (bin ``i`` holds value ``i``)."""
+    return np.arange(counts.size) @ counts / counts.sum()
+
+def distribution_stats(counts: np.ndarray) -> tuple[float, float, float]:
+    """Mean, 5th and 95th percentile of simulated integer totals, read off their bin counts."""
+    p5, p95 = quantiles_from_counts(counts, [0.05, 0.95])
+    return mean_from_counts(counts), p5, p95
+
+# Layout shared by every distribution figure; create_histogram() adds the titles
+HISTOGRAM_LAYOUT = {
+    'margin': {'t': 60},
+    'yaxis': {'title': 'Frequency'},
+    'bargap': 0,
+    'plot_bgcolor': '#f8f9fa'
+}
+
+def create_histogram(counts: np.ndarray, stats: tuple[float, float, float], color: str, title: str,
+                     games: int = 1) -> dict:
+    """Generate a Plotly bar-chart histogram from ``np.bincount`` counts and their ``distribution_stats``."""
+    mean, p5, p95 = stats
+    low = np.flatnonzero(counts)[0]
+    # Per-game averages land on multiples of 1 / games; round them for the hover label
+    x_format = '%{x:.2f}' if games > 1 else '%{x}'
     return {
         'data': [{
-            'x': data,
-            'type': 'histogram',
+            # Bin k sits at k / games (a per-game average when games > 1); the bins are
+            # evenly spaced, so Plotly places them from x0/dx and no x array is sent
+            'x0': low / games,
+            'dx': 1 / games,
+            'y': counts[low:],
+            'width': 1 / games,
+            'type': 'bar',
             'marker': {'color': color},
-            'hovertemplate': f'{title}: %{{x}}<extra></extra>'
+            'hovertemplate': f'{title}: {x_format}<extra></extra>'
         }],
         'layout': {
             'title': {
@@ -62,20 +192,62 @@ def create_histogram(data: np.ndarray, color: str, title: str) -> dict:
                 'x': 0.5,
                 'xanchor': 'center'
             },
-            'margin': {'t': 60},
             'xaxis': {'title': f'Total {title}'},
-            'yaxis': {'title': 'Frequency'},
-            'plot_bgcolor': '#f8f9fa'
+            **HISTOGRAM_LAYOUT
         }
     }
 
+# ---------------------------
+# Precomputed Slider Outputs
+# ---------------------------
+def build_salah_outputs(num_games: int) -> tuple[str, dict, dict]:
+    """Summary text and goals/assists figures for one Salah slider position."""
+    # Each distribution is binned once; its statistics and bars share the counts
+    goals_counts, assists_counts = map(np.bincount, SALAH_SIMULATIONS[num_games])
+    goals_mean, goals_5th, goals_95th = goals_stats = distribution_stats(goals_counts)
+    
+    goals_fig = create_histogram(goals_counts, goals_stats, '#C8102E', 'Goals')
+    assists_fig = create_histogram(assists_counts, distribution_stats(assists_counts), '#00B2A9', 'Assists')
+    
+    summary_text = (
+        f"Simulating {num_games} games, Salah is predicted to score between "
+        f"{goals_5th} and {goals_95th} goals, with an average of {goals_mean:.2f} goals."
+    )
+    
+    return summary_text, goals_fig, assists_fig
+
+def build_lebron_outputs(num_games: int) -> tuple[str, dict, dict, dict]:
+    """Summary text and PTS/AST/REB figures for one LeBron slider position."""
+    # Season totals are binned once; statistics are read off the counts, expressed per game
+    pts_counts, ast_counts, reb_counts = map(np.bincount, LEBRON_SIMULATIONS[num_games])
+    pts_stats, ast_stats, reb_stats = (np.divide(distribution_stats(counts), num_games)
+                                       for counts in (pts_counts, ast_counts, reb_counts))
+    
+    points_fig = create_histogram(pts_counts, pts_stats, '#FDF667', 'PTS', num_games)
+    assists_fig = create_histogram(ast_counts, ast_stats, '#00B2A9', 'AST', num_games)
+    rebounds_fig = create_histogram(reb_counts, reb_stats, '#C8102E', 'REB', num_games)
+    
+    summary_text = (
+        f"In a simulated {num_games}-game season, LeBron averaged {pts_stats[0]:.2f} PTS, "
+        f"{ast_stats[0]:.2f} AST, and {reb_stats[0]:.2f} REB per game."
+    )
+    
+    return summary_text, points_fig, assists_fig, rebounds_fig
+
+# Shipped to the browser in dcc.Store so slider moves never reach the server.
+# Serialized once here so page loads don't re-encode every figure's arrays.
+SALAH_OUTPUTS = {n: to_json_plotly(build_salah_outputs(n)) for n in SALAH_GAMES}
+LEBRON_OUTPUTS = {n: to_json_plotly(build_lebron_outputs(n)) for n in LEBRON_GAMES}
+
 # ---------------------------
 # App Initialization and Light/Dark Toggle
 # ---------------------------
 external_stylesheets = [dbc.themes.BOOTSTRAP, dbc.icons.FONT_AWESOME]
 app = Dash(__name__,
            external_stylesheets=external_stylesheets,
+           compress=True,  # gzip/brotli via flask-compress
            meta_tags=[{"name": "viewport", "content": "width=device-width, initial-scale=1, shrink-to-fit=yes"}])
+server = app.server  # WSGI entry point for gunicorn (see Procfile)
 
 color_mode_switch = html.Span(
     [
@@ -97,22 +269,24 @@ color_mode_switch = html.Span(
 # Salah simulation slider
 salah_slider = dcc.Slider(
     id='num-games-slider',
-    min=10,
-    max=38,
+    min=SALAH_GAMES[0],
+    max=SALAH_GAMES[-1],
     step=1,
-    value=38,
-    marks={i: str(i) for i in range(10, 39, 4)},
+    value=SALAH_GAMES[-1],
+    marks={i: str(i) for i in SALAH_GAMES[::4]},
+    updatemode='mouseup',
     tooltip={"placement": "bottom", "always_visible": True}
 )
 
 # LeBron simulation slider
 lebron_slider = dcc.Slider(
     id='num-games-slider-lebron',
-    min=60,
-    max=82,
+    min=LEBRON_GAMES[0],
+    max=LEBRON_GAMES[-1],
     step=1,
-    value=82,
-    marks={i: str(i) for i in range(60, 83, 2)},
+    value=LEBRON_GAMES[-1],
+    marks={i: str(i) for i in LEBRON_GAMES[::2]},
+    updatemode='mouseup',
     tooltip={"placement": "bottom", "always_visible": True}
 )
 
@@ -132,7 +306,9 @@ app.layout = dbc.Container([
         )
     ),
     html.Div(id='tabs-content'),
-    dbc.Row(dbc.Col(color_mode_switch))
+    dbc.Row(dbc.Col(color_mode_switch)),
+    dcc.Store(id='salah-outputs', data=SALAH_OUTPUTS),
+    dcc.Store(id='lebron-outputs', data=LEBRON_OUTPUTS)
 ], fluid=True)
 
 # ---------------------------
@@ -190,54 +366,32 @@ def render_tab_content(active_tab):
         ])
 
 # ---------------------------
-# Callback: Update Mohamed Salah Graphs
+# Clientside Callbacks: Select Precomputed Slider Outputs
 # ---------------------------
-@app.callback(
+select_precomputed_outputs = """
+    function(numGames, outputs) {
+        return JSON.parse(outputs[numGames]);
+    }
+    """
+
+clientside_callback(
+    select_precomputed_outputs,
     [Output('slider-output', 'children'),
      Output('goals-distribution', 'figure'),
      Output('assists-distribution', 'figure')],
-    Input('num-games-slider', 'value')
+    Input('num-games-slider', 'value'),
+    State('salah-outputs', 'data')
 )
-def update_salah_output(num_games: int):
-    goals_data, assists_data = monte_carlo_simulation_salah(num_games)
-    
-    goals_fig = create_histogram(goals_data, '#C8102E', 'Goals')
-    assists_fig = create_histogram(assists_data, '#00B2A9', 'Assists')
-    
-    goals_mean = goals_data.mean()
-    goals_5th = np.percentile(goals_data, 5)
-    goals_95th = np.percentile(goals_data, 95)
-    
-    summary_text = (
-        f"Simulating {num_games} games, Salah is predicted to score between "
-        f"{goals_5th} and {goals_95th} goals, with an average of {goals_mean:.2f} goals."
-    )
-    
-    return summary_text, goals_fig, assists_fig
 
-# ---------------------------
-# Callback: Update LeBron James Graphs
-# ---------------------------
-@app.callback(
+clientside_callback(
+    select_precomputed_outputs,
     [Output('slider-output-lebron', 'children'),
      Output('points-distribution', 'figure'),
      Output('assists-distribution-lebron', 'figure'),
      Output('rebounds-distribution', 'figure')],
-    Input('num-games-slider-lebron', 'value')
+    Input('num-games-slider-lebron', 'value'),
+    State('lebron-outputs', 'data')
 )
-def update_lebron_output(num_games: int):
-    simulated_pts, simulated_ast, simulated_reb = monte_carlo_simulation_lebron(num_games)
-    
-    points_fig = create_histogram(simulated_pts, '#FDF667', 'PTS')
-    assists_fig = create_histogram(simulated_ast, '#00B2A9', 'AST')
-    rebounds_fig = create_histogram(simulated_reb, '#C8102E', 'REB')
-    
-    summary_text = (
-        f"In a simulated {num_games}-game season, LeBron averaged {simulated_pts.mean():.2f} PTS, "
-        f"{simulated_ast.mean():.2f} AST, and {simulated_reb.mean():.2f} REB per game."
-    )
-    
-    return summary_text, points_fig, assists_fig, rebounds_fig
 
 # ---------------------------
 # Clientside Callback for Light/Dark Mode
@@ -260,8 +414,9 @@ clientside_callback(
 # ---------------------------
 # Run Server
 # ---------------------------
+# Production runs under gunicorn (see Procfile); this is the local dev server.
 if __name__ == '__main__':
-    app.run_server(
+    app.run(
         host=os.environ.get("HOST", "0.0.0.0"),
         port=int(os.environ.get("PORT", 8050)),
         debug=os.environ.get("DEBUG", "False") == "True"